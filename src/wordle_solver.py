@@ -4,6 +4,8 @@
 
 USAGE
 
+    This tool requires NumPy ('pip install numpy').
+
     wordle_solver.py webdemo
       demonstrates solving a Wordle puzzle on the NYT website;
       requires selenium and webdriver-manager to be installed.
@@ -36,13 +38,29 @@ USAGE
 
 from collections import defaultdict
 from datetime import datetime
-from typing import Callable, Dict, List, Tuple
+from typing import Callable, List, Tuple
 
+import functools
+import itertools
+import multiprocessing
 import os
 import random
 import sys
 import time
 
+import numpy as np
+
+
+def PrintInstallHint(hint: str) -> None:
+    """Prints a hint about installing an optional dependency.
+
+    Pool workers started with the "spawn" method (the default on macOS and
+    Windows) re-import this module, so only the main process prints the hint.
+    """
+    if multiprocessing.parent_process() is None:
+        print(hint)
+
+
 WEB_AUTOMATION = True
 try:
     from selenium import webdriver
@@ -51,7 +69,7 @@ try:
     from selenium.webdriver.chrome.service import Service as ChromeService
     from selenium.webdriver.common.by import By
 except ModuleNotFoundError:
-    print(
+    PrintInstallHint(
         "To automate interaction with the game site, run 'pip install selenium' "
         "to install the selenium python binding."
     )
@@ -60,113 +78,476 @@ except ModuleNotFoundError:
 try:
     from webdriver_manager.chrome import ChromeDriverManager
 except ModuleNotFoundError:
-    print(
+    PrintInstallHint(
         "To automate interaction with the game site, run 'pip install webdriver-manager' "
         "to install the webdriver-manager python library."
     )
     WEB_AUTOMATION = False
 
+JIT_COMPILATION = True
+try:
+    from numba import njit, prange
+except ModuleNotFoundError:
+    PrintInstallHint(
+        "To speed up the search for the best words, run 'pip install numba' "
+        "to install the numba JIT compiler."
+    )
+    JIT_COMPILATION = False
+
+    def njit(*args, **kwargs):
+        """Stands in for numba.njit, leaving the decorated function as is."""
+        if args and callable(args[0]):
+            return args[0]
+        return lambda f: f
+
+    prange = range
+
 
 def GetWordList(rel_path: str) -> List[str]:
     py_file_dir = os.path.dirname(__file__)
     wordle_list_file = os.path.join(py_file_dir, rel_path)
-    words = []
     with open(wordle_list_file, "r") as f:
-        for line in f.readlines():
-            word = line.strip().upper()
-            if len(word) == 5:
-                words.append(word)
-    return words
+        return [word for word in f.read().upper().split() if len(word) == 5]
 
 
 VALID_ANSWERS = GetWordList("valid-answers.txt")
 VALID_ANSWER_SET = set(VALID_ANSWERS)
 VALID_NON_ANSWER_GUESSES = GetWordList("valid-guesses.txt")
 ALL_WORDS = VALID_ANSWERS + VALID_NON_ANSWER_GUESSES
+# Maps each valid guess to its index in ALL_WORDS.
+WORD_INDEX = {word: i for i, word in enumerate(ALL_WORDS)}
 
 
-def GetLetterFrequencies(words: List[str]) -> Dict[str, int]:
-    letter_freq = defaultdict(int)
-    for word in words:
-        # Only consider valid answer words when calcultating letter frequencies.
-        if word not in VALID_ANSWER_SET:
-            continue
+# WORD_CHARS[i, j] is the j-th letter of ALL_WORDS[i], as 0 (A) to 25 (Z).
+WORD_CHARS = np.frombuffer("".join(ALL_WORDS).encode("ascii"), dtype=np.uint8).reshape(
+    -1, 5
+) - ord("A")
+# WORD_HAS[i, c] is True iff ALL_WORDS[i] contains the c-th letter.
+WORD_HAS = np.zeros((len(ALL_WORDS), 26), dtype=bool)
+WORD_HAS[np.arange(len(ALL_WORDS))[:, None], WORD_CHARS] = True
+# WORD_MASKS[i] is the letter mask of ALL_WORDS[i]: a 26-bit mask whose bit c is
+# set iff the word contains the c-th letter.
+WORD_MASKS = np.bitwise_or.reduce(
+    np.left_shift(np.uint32(1), WORD_CHARS.astype(np.uint32)), axis=1
+)
+# VALID_ANSWER_MASK[i] is True iff ALL_WORDS[i] is a valid answer.
+VALID_ANSWER_MASK = np.array([word in VALID_ANSWER_SET for word in ALL_WORDS])
 
-        for letter in word:
-            letter_freq[letter] += 1
-    return letter_freq
 
+def GetWordIndices(words: List[str]) -> np.ndarray:
+    """Returns the indices of the given words in ALL_WORDS."""
+    return np.array([WORD_INDEX[word] for word in words], dtype=np.int64)
 
-def GetWordWithHighestLetterFrequencies(
-    words_for_freq: List[str], candidates: List[str]
-) -> str:
-    # Precondition.
-    assert words_for_freq
-    assert candidates
 
-    letter_freq = GetLetterFrequencies(words_for_freq)
-    best_word = None
+# The indices of all valid guesses.
+ALL_WORD_INDICES = np.arange(len(ALL_WORDS))
+
+
+def GetLetterFrequencies(word_indices: np.ndarray) -> np.ndarray:
+    """Returns how many times each letter occurs in the given words.
+
+    Args:
+        word_indices: indices of words in ALL_WORDS.
+
+    Returns:
+        a length-26 array, whose i-th element is the frequency of the i-th letter.
+    """
+    # Only consider valid answer words when calcultating letter frequencies.
+    answer_indices = word_indices[VALID_ANSWER_MASK[word_indices]]
+    return np.bincount(WORD_CHARS[answer_indices].ravel(), minlength=26)
+
+
+@njit(cache=True)
+def GetWordWithHighestLetterFrequenciesJit(
+    word_indices_for_freq: np.ndarray,
+    candidate_indices: np.ndarray,
+    word_chars: np.ndarray,
+    valid_answer_mask: np.ndarray,
+) -> int:
+    """A compiled version of GetWordWithHighestLetterFrequencies.
+
+    word_chars and valid_answer_mask should be WORD_CHARS and VALID_ANSWER_MASK.
+
+    Returns:
+        the index of the best candidate in ALL_WORDS, or -1 if no candidate
+        has a positive letter frequency.
+    """
+    letter_freq = np.zeros(26, dtype=np.int64)
+    for i in word_indices_for_freq:
+        if valid_answer_mask[i]:
+            for j in range(5):
+                letter_freq[word_chars[i, j]] += 1
+
+    best_index = -1
     max_freq = 0
-    for word in candidates:
-        freq = sum(letter_freq[ch] for ch in set(word))
+    for i in candidate_indices:
+        # Sum the frequencies of the distinct letters, found by remembering
+        # the letters seen so far in a mask.
+        freq = 0
+        seen = 0
+        for j in range(5):
+            letter_bit = 1 << word_chars[i, j]
+            if not seen & letter_bit:
+                freq += letter_freq[word_chars[i, j]]
+            seen |= letter_bit
         if freq > max_freq:
             max_freq = freq
-            best_word = word
-    assert best_word is not None
-    return best_word
+            best_index = i
+    return best_index
+
+
+def GetWordWithHighestLetterFrequencies(
+    word_indices_for_freq: np.ndarray, candidate_indices: np.ndarray
+) -> str:
+    """Returns the candidate whose distinct letters are the most frequent.
+
+    Args:
+        word_indices_for_freq: indices of the words (in ALL_WORDS) to compute
+                               the letter frequencies from.
+        candidate_indices: indices of the candidates in ALL_WORDS.  Earlier
+                           candidates win ties.
+    """
+    # Precondition.
+    assert len(word_indices_for_freq)
+    assert len(candidate_indices)
+
+    if len(candidate_indices) == 1:
+        # There's nothing to choose from.
+        return ALL_WORDS[candidate_indices[0]]
+
+    if JIT_COMPILATION:
+        best_index = GetWordWithHighestLetterFrequenciesJit(
+            word_indices_for_freq, candidate_indices, WORD_CHARS, VALID_ANSWER_MASK
+        )
+        assert best_index >= 0
+        return ALL_WORDS[best_index]
+
+    letter_freq = GetLetterFrequencies(word_indices_for_freq)
+    freqs = WORD_HAS[candidate_indices] @ letter_freq
+    best = freqs.argmax()
+    assert freqs[best] > 0
+    return ALL_WORDS[candidate_indices[best]]
+
+
+# LETTER_BITS[i] is the mask of the i-th letter of the alphabet.
+LETTER_BITS = np.left_shift(np.uint32(1), np.arange(26, dtype=np.uint32))
 
 
-def GetWordLetterFrequency(word: str, letter_freq: Dict[str, int]) -> int:
-    return sum(letter_freq[letter] for letter in set(word))
+def GetLetterMaskFrequencies(masks: np.ndarray, letter_freq: np.ndarray) -> np.ndarray:
+    """Returns the letter frequency of each letter mask in masks.
 
+    Args:
+        masks: an array of 26-bit letter masks (see WORD_MASKS).
+        letter_freq: a length-26 array of letter frequencies.
+    """
+    # Expand each mask into 26 booleans (one per letter) and sum the
+    # frequencies of the letters that are present.
+    return ((masks[..., None] & LETTER_BITS) != 0) @ letter_freq
+
+
+def SortByLetterMaskFrequencies(
+    masks: np.ndarray, letter_freq: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Returns (order, freqs) s.t. masks[order] is sorted by decreasing freqs.
+
+    Masks with the same frequency keep their relative order.
+    """
+    freqs = GetLetterMaskFrequencies(masks, letter_freq)
+    order = np.argsort(-freqs, kind="stable")
+    return order, freqs[order]
 
-# This returns 300 best pairs.  TODO: find which of the 300 is the best.
+
+def CountAtLeast(sorted_freqs: np.ndarray, min_freq: int) -> int:
+    """Returns the number of items in sorted_freqs (descending) that are >= min_freq."""
+    return int(np.searchsorted(-sorted_freqs, -min_freq, side="right"))
+
+
+# This returns 718 best pairs.  TODO: find which of the 718 is the best.
 def GetWordPairsWithHighestLetterFrequencies(words: List[str]) -> List[Tuple[str, str]]:
-    letter_freq = GetLetterFrequencies(words)
-    candidates = words
-    candidate_freqs = [
-        (word, GetWordLetterFrequency(word, letter_freq)) for word in candidates
-    ]
-    candidate_to_freq = {pair[0]: pair[1] for pair in candidate_freqs}
-    sorted_candidate_freqs = sorted(
-        candidate_freqs, key=lambda pair: pair[1], reverse=True
-    )
-    sorted_candidates = [pair[0] for pair in sorted_candidate_freqs]
+    word_indices = GetWordIndices(words)
+    letter_freq = GetLetterFrequencies(word_indices)
+    masks = WORD_MASKS[word_indices]
+    # Sorting the words by decreasing frequency lets us prune most pairs (see
+    # below), so only ~1000 of the word1 values are ever tried.
+    order, sorted_freqs = SortByLetterMaskFrequencies(masks, letter_freq)
+    sorted_words = [words[i] for i in order]
+    sorted_masks = masks[order]
     best_pairs = []
     max_freq = 0
-    num_words = len(sorted_candidates)
-    for i, word1 in enumerate(sorted_candidates):
-        word1_freq = candidate_to_freq[word1]
-        for j in range(i + 1, num_words):
-            word2 = sorted_candidates[j]
-            word2_freq = candidate_to_freq[word2]
-            # Optimization: the letter frequency of (word1, word2) is at most
-            # the letter frequency of word1 + the letter frequency of word2
-            # (it can be smaller as word1 and word2 may contain overlapping
-            # letters).  Therefore there's no need to try the remaining possible
-            # word2 values if they cannot possibly beat max_freq.
-            if word1_freq + word2_freq < max_freq:
-                break
-            freq = GetWordLetterFrequency(word1 + word2, letter_freq)
-            if freq > max_freq:
-                max_freq = freq
-                best_pairs = [(word1, word2)]
-            elif freq == max_freq:
-                best_pairs.append((word1, word2))
+    num_words = len(sorted_words)
+    for i in range(num_words):
+        # Optimization: the letter frequency of (word1, word2) is at most
+        # the letter frequency of word1 + the letter frequency of word2
+        # (it can be smaller as word1 and word2 may contain overlapping
+        # letters).  Therefore there's no need to try the word2 values
+        # that cannot possibly beat max_freq.  As the words are sorted by
+        # decreasing frequency, the word2 values worth trying form a
+        # contiguous range.
+        end = CountAtLeast(sorted_freqs, max_freq - sorted_freqs[i])
+        if end <= i + 1:
+            # No later word1 can do better either.
+            break
+        freqs = GetLetterMaskFrequencies(
+            sorted_masks[i] | sorted_masks[i + 1 : end], letter_freq
+        )
+        slice_max_freq = int(freqs.max())
+        if slice_max_freq < max_freq:
+            continue
+        if slice_max_freq > max_freq:
+            max_freq = slice_max_freq
+            best_pairs = []
+        for j in np.flatnonzero(freqs == max_freq):
+            best_pairs.append((sorted_words[i], sorted_words[i + 1 + j]))
     return best_pairs
 
 
-def NormalizeWordAsLetterSet(word: str) -> str:
-    # hello => ehlo
-    # basic => abcis
-    return "".join(sorted(set(word)))
+# Letter masks are split into two halves of HALF_MASK_BITS bits, so that the
+# letter frequency of any mask is the sum of two table lookups (see
+# GetHalfMaskFrequenciesJit).
+HALF_MASK_BITS = 13
+
+
+@njit(cache=True)
+def GetHalfMaskFrequenciesJit(letter_freq: np.ndarray) -> np.ndarray:
+    """Returns the letter frequencies of all masks of HALF_MASK_BITS bits.
+
+    Row 0 is for the low half of a letter mask, and row 1 for the high half.
+    """
+    num_masks = 1 << HALF_MASK_BITS
+    freqs = np.zeros((2, num_masks), dtype=np.int64)
+    for half in range(2):
+        for mask in range(1, num_masks):
+            # Add the frequency of the lowest letter to that of the others.
+            lowest = 0
+            while not (mask >> lowest) & 1:
+                lowest += 1
+            freqs[half, mask] = (
+                freqs[half, mask & (mask - 1)]
+                + letter_freq[half * HALF_MASK_BITS + lowest]
+            )
+    return freqs
+
+
+@njit(cache=True)
+def GetLetterMaskFrequencyJit(mask: int, half_mask_freqs: np.ndarray) -> int:
+    """Returns the letter frequency of the given letter mask.
+
+    half_mask_freqs must be the result of GetHalfMaskFrequenciesJit.
+    """
+    low_half = mask & ((1 << HALF_MASK_BITS) - 1)
+    return half_mask_freqs[0, low_half] + half_mask_freqs[1, mask >> HALF_MASK_BITS]
+
+
+@njit(cache=True)
+def GetMaxNewLetterFrequencyJit(
+    mask: int, num_letters: int, letter_freq: np.ndarray, letter_order: np.ndarray
+) -> int:
+    """Returns the highest frequency num_letters letters not in mask can add.
+
+    letter_order must list the letters by decreasing letter_freq.
+    """
+    freq = 0
+    for letter in letter_order:
+        if num_letters == 0:
+            break
+        if not (mask >> letter) & 1:
+            freq += letter_freq[letter]
+            num_letters -= 1
+    return freq
+
+
+@njit(cache=True)
+def FindBestTriplesStartingAt(
+    i: int,
+    sorted_masks: np.ndarray,
+    sorted_freqs: np.ndarray,
+    letter_freq: np.ndarray,
+    letter_order: np.ndarray,
+    half_mask_freqs: np.ndarray,
+    min_freq: int,
+    triples: np.ndarray,
+    start: int,
+) -> Tuple[int, int]:
+    """Finds the triples (i, j, k) with the highest letter frequency >= min_freq.
+
+    sorted_freqs[i] must be the letter frequency of sorted_masks[i], in
+    decreasing order, letter_order must list the letters by decreasing
+    letter_freq, and half_mask_freqs must be computed from letter_freq by
+    GetHalfMaskFrequenciesJit.  Unless triples is empty, the triples are written to
+    triples[start:] in increasing (j, k) order.
+
+    Returns:
+        (max_freq, count), where count is the number of triples found; count
+        is 0 if no triple reaches min_freq.
+    """
+    max_freq = min_freq
+    count = 0
+    num_candidates = len(sorted_masks)
+    # Two more words add at most 10 new letters, and at best the most
+    # frequent ones.
+    if sorted_freqs[i] + GetMaxNewLetterFrequencyJit(
+        sorted_masks[i], 10, letter_freq, letter_order
+    ) < max_freq:
+        return max_freq, count
+    # The last candidate can't start a (j, k) pair.
+    for j in range(i + 1, num_candidates - 1):
+        # The third word's frequency is at most that of the (j + 1)-th.
+        if sorted_freqs[i] + sorted_freqs[j] + sorted_freqs[j + 1] < max_freq:
+            break
+        mask1_2 = sorted_masks[i] | sorted_masks[j]
+        freq1_2 = GetLetterMaskFrequencyJit(mask1_2, half_mask_freqs)
+        # Likewise, the third word adds at most 5 new letters.
+        if freq1_2 + GetMaxNewLetterFrequencyJit(
+            mask1_2, 5, letter_freq, letter_order
+        ) < max_freq:
+            continue
+        for k in range(j + 1, num_candidates):
+            if freq1_2 + sorted_freqs[k] < max_freq:
+                break
+            freq = GetLetterMaskFrequencyJit(
+                mask1_2 | sorted_masks[k], half_mask_freqs
+            )
+            if freq >= max_freq:
+                if freq > max_freq:
+                    max_freq = freq
+                    count = 0
+                if len(triples):
+                    triples[start + count, 0] = i
+                    triples[start + count, 1] = j
+                    triples[start + count, 2] = k
+                count += 1
+    return max_freq, count
+
+
+@njit(parallel=True, cache=True)
+def SearchBestTriplesJit(
+    sorted_masks: np.ndarray, sorted_freqs: np.ndarray, letter_freq: np.ndarray
+) -> np.ndarray:
+    """Returns the (i, j, k) indices of the triples with the highest frequency.
+
+    This is a compiled version of SearchBestTriples that searches the triples
+    in parallel over i.
+    """
+    num_candidates = len(sorted_masks)
+    letter_order = np.argsort(-letter_freq)
+    half_mask_freqs = GetHalfMaskFrequenciesJit(letter_freq)
+    no_triples = np.empty((0, 3), dtype=np.int64)
+    # The best triple starting with the first candidate gives a lower bound
+    # of the highest frequency, which the parallel searches use for pruning.
+    min_freq, _ = FindBestTriplesStartingAt(
+        0,
+        sorted_masks,
+        sorted_freqs,
+        letter_freq,
+        letter_order,
+        half_mask_freqs,
+        0,
+        no_triples,
+        0,
+    )
+    max_freqs = np.zeros(num_candidates, dtype=np.int64)
+    counts = np.zeros(num_candidates, dtype=np.int64)
+    for i in prange(num_candidates):
+        max_freqs[i], counts[i] = FindBestTriplesStartingAt(
+            i,
+            sorted_masks,
+            sorted_freqs,
+            letter_freq,
+            letter_order,
+            half_mask_freqs,
+            min_freq,
+            no_triples,
+            0,
+        )
+    max_freq = max_freqs[counts > 0].max()
+    # Only a few candidates start a best triple; collect their triples.
+    best_candidates = np.flatnonzero((counts > 0) & (max_freqs == max_freq))
+    starts = np.zeros(len(best_candidates) + 1, dtype=np.int64)
+    starts[1:] = np.cumsum(counts[best_candidates])
+    triples = np.empty((starts[-1], 3), dtype=np.int64)
+    for n in prange(len(best_candidates)):
+        FindBestTriplesStartingAt(
+            best_candidates[n],
+            sorted_masks,
+            sorted_freqs,
+            letter_freq,
+            letter_order,
+            half_mask_freqs,
+            max_freq,
+            triples,
+            starts[n],
+        )
+    return triples
+
+
+def SearchBestTriples(
+    sorted_words: List[str],
+    sorted_masks: np.ndarray,
+    sorted_freqs: np.ndarray,
+    letter_freq: np.ndarray,
+) -> List[Tuple[int, int, int]]:
+    """Returns the (i, j, k) indices of the triples with the highest frequency.
+
+    sorted_masks[i] must be the letter mask of sorted_words[i], and
+    sorted_freqs[i] its letter frequency, in decreasing order.
+    """
+    best_triples = []
+    max_freq = 0
+    num_candidates = len(sorted_masks)
+    letter_order = np.argsort(-letter_freq)
+    for i in range(num_candidates):
+        print(f"{i} - {sorted_words[i]}")
+        candidate1_freq = sorted_freqs[i]
+        if candidate1_freq + GetMaxNewLetterFrequencyJit(
+            sorted_masks[i], 10, letter_freq, letter_order
+        ) < max_freq:
+            continue
+        for j in range(i + 1, num_candidates - 1):
+            if candidate1_freq + sorted_freqs[j] + sorted_freqs[j + 1] < max_freq:
+                break
+            mask1_2 = sorted_masks[i] | sorted_masks[j]
+            candidate1_2_freq = int(GetLetterMaskFrequencies(mask1_2, letter_freq))
+            if candidate1_2_freq + GetMaxNewLetterFrequencyJit(
+                mask1_2, 5, letter_freq, letter_order
+            ) < max_freq:
+                continue
+            # Only candidate3 values with candidate1_2_freq + candidate3_freq
+            # >= max_freq can possibly beat max_freq.
+            end = CountAtLeast(sorted_freqs, max_freq - candidate1_2_freq)
+            if end <= j + 1:
+                continue
+            freqs = GetLetterMaskFrequencies(
+                mask1_2 | sorted_masks[j + 1 : end], letter_freq
+            )
+            slice_max_freq = int(freqs.max())
+            if slice_max_freq < max_freq:
+                continue
+            if slice_max_freq > max_freq:
+                max_freq = slice_max_freq
+                best_triples = []
+            for k in np.flatnonzero(freqs == max_freq):
+                best_triples.append((i, j, j + 1 + int(k)))
+    return best_triples
+
+
+def GetLetterSetRepresentatives(word_indices: np.ndarray) -> np.ndarray:
+    """Returns the index of one word per distinct set of letters in word_indices.
+
+    The letter sets are in the order they first occur, and each is represented
+    by the last word with that set of letters.
+    """
+    masks = WORD_MASKS[word_indices]
+    _, first = np.unique(masks, return_index=True)
+    _, last_from_end = np.unique(masks[::-1], return_index=True)
+    last = len(masks) - 1 - last_from_end
+    return word_indices[last[np.argsort(first)]]
 
 
 def GetWordTriplesWithHighestLetterFrequencies(
     words: List[str],
 ) -> List[Tuple[str, str, str]]:
-    letter_freq = GetLetterFrequencies(words)
-    candidate_words = words
+    word_indices = GetWordIndices(words)
+    letter_freq = GetLetterFrequencies(word_indices)
 
     # For the purpose of letter frequency coverage, the order of the letters
     # in a word and duplicated letters don't matter.  Therefore we can treat
@@ -175,53 +556,23 @@ def GetWordTriplesWithHighestLetterFrequencies(
     # consider SALES and LESSA as different words as they contain the same
     # set of letters.  With this optimization, we only need to consider 7622
     # candidates instead of 12947.  This greatly speeds up this function,
-    # which has O(N^3) time complexity.
-    candidate_to_word = {
-        NormalizeWordAsLetterSet(word): word for word in candidate_words
-    }
-    candidates = candidate_to_word.keys()
-    candidate_freqs = [
-        (candidate, GetWordLetterFrequency(candidate, letter_freq))
-        for candidate in candidates
+    # which has O(N^3) time complexity.  The letter sets are precomputed in
+    # WORD_MASKS.
+    candidate_indices = GetLetterSetRepresentatives(word_indices)
+    masks = WORD_MASKS[candidate_indices]
+    order, sorted_freqs = SortByLetterMaskFrequencies(masks, letter_freq)
+    sorted_words = [ALL_WORDS[i] for i in candidate_indices[order]]
+    sorted_masks = masks[order]
+    print(f"Processing {len(sorted_words)} candidates.")
+    if JIT_COMPILATION:
+        best_triples = SearchBestTriplesJit(sorted_masks, sorted_freqs, letter_freq)
+    else:
+        best_triples = SearchBestTriples(
+            sorted_words, sorted_masks, sorted_freqs, letter_freq
+        )
+    return [
+        (sorted_words[i], sorted_words[j], sorted_words[k]) for i, j, k in best_triples
     ]
-    candidate_to_freq = {pair[0]: pair[1] for pair in candidate_freqs}
-    sorted_candidate_freqs = sorted(
-        candidate_freqs, key=lambda pair: pair[1], reverse=True
-    )
-    sorted_candidates = [pair[0] for pair in sorted_candidate_freqs]
-    best_triples = []
-    max_freq = 0
-    num_candidates = len(sorted_candidates)
-    print(f"Processing {num_candidates} candidates.")
-    for i, candidate1 in enumerate(sorted_candidates):
-        word1 = candidate_to_word[candidate1]
-        print(f"{i} - {word1}")
-        candidate1_freq = candidate_to_freq[candidate1]
-        for j in range(i + 1, num_candidates):
-            candidate2 = sorted_candidates[j]
-            word2 = candidate_to_word[candidate2]
-            candidate2_freq = candidate_to_freq[candidate2]
-            if candidate1_freq + 2 * candidate2_freq < max_freq:
-                break
-            candidate1_2_freq = GetWordLetterFrequency(
-                candidate1 + candidate2, letter_freq
-            )
-            for k in range(j + 1, num_candidates):
-                candidate3 = sorted_candidates[k]
-                candidate3_freq = candidate_to_freq[candidate3]
-                if candidate1_2_freq + candidate3_freq < max_freq:
-                    break
-                freq = GetWordLetterFrequency(
-                    candidate1 + candidate2 + candidate3, letter_freq
-                )
-                if freq >= max_freq:
-                    triple = (word1, word2, candidate_to_word[candidate3])
-                    if freq > max_freq:
-                        max_freq = freq
-                        best_triples = [triple]
-                    else:  # freq == max_freq
-                        best_triples.append(triple)
-    return best_triples
 
 
 def GetHints(guess: str, answer: str) -> str:
@@ -237,41 +588,99 @@ def GetHints(guess: str, answer: str) -> str:
     return hints
 
 
-def MatchesHints(word: str, guess: str, hints: str) -> bool:
-    for i, hint in enumerate(hints):
-        if hint == "M":
-            if word[i] != guess[i]:
-                return False
-        elif hint == "O":
-            if word[i] == guess[i]:
-                return False
-            elif guess[i] not in word:
-                return False
-        else:
-            if guess[i] in word:
-                return False
-    return True
+# Hints are encoded as a base-3 number with one digit per letter, the first
+# letter being the most significant digit: X = 0, O = 1, and M = 2.
+# DECODED_HINTS[code] is the hints string encoded as code.
+DECODED_HINTS = ["".join(hints) for hints in itertools.product("XOM", repeat=5)]
+
+
+def EncodeHints(hints: str) -> int:
+    code = 0
+    for hint in hints:
+        code = code * 3 + "XOM".index(hint)
+    return code
+
+
+@functools.lru_cache(maxsize=None)
+def GetHintCodes(guess_index: int) -> np.ndarray:
+    """Returns the encoded hints for ALL_WORDS[guess_index] against every answer.
+
+    I.e. GetHintCodes(g)[a] is EncodeHints(GetHints(ALL_WORDS[g], ALL_WORDS[a])).
+    This is a row of the (guess, answer) -> hints table, which is computed
+    lazily as only a small fraction of the words are ever guessed.
+    """
+    codes = np.zeros(len(ALL_WORDS), dtype=np.uint8)
+    for i, letter in enumerate(WORD_CHARS[guess_index]):
+        match = WORD_CHARS[:, i] == letter
+        codes *= 3
+        codes += np.where(match, 2, WORD_HAS[:, letter]).astype(np.uint8)
+    codes.flags.writeable = False  # The result is cached and thus shared.
+    return codes
+
+
+def GetHintCode(guess: str, answer: str) -> int:
+    """Returns EncodeHints(GetHints(guess, answer)) by looking it up."""
+    return int(GetHintCodes(WORD_INDEX[guess])[WORD_INDEX[answer]])
+
 
+# The code of "MMMMM", i.e. the guess is the answer.
+SOLVED_HINT_CODE = EncodeHints("MMMMM")
 
-def FilterByHints(words: List[str], guess: str, hints: str) -> List[str]:
-    return [word for word in words if MatchesHints(word, guess, hints)]
+
+def FilterByHintCode(candidate_mask: np.ndarray, guess: str, hint_code: int) -> np.ndarray:
+    """Returns the mask of the candidates that are consistent with the hints.
+
+    A word matches the hints for guess iff guessing guess when the word is the
+    answer would give the same hints.  Therefore the matching words are
+    exactly the ones with the same code in guess's row of the hints table.
+    """
+    return candidate_mask & (GetHintCodes(WORD_INDEX[guess]) == hint_code)
+
+
+def FilterByHints(candidate_mask: np.ndarray, guess: str, hints: str) -> np.ndarray:
+    """Like FilterByHintCode(), but takes the hints as a string."""
+    return FilterByHintCode(candidate_mask, guess, EncodeHints(hints))
 
 
 def Colored(r: int, g: int, b: int, text: str) -> str:
     return f"\033[38;2;{r};{g};{b}m{text}\033[38;2;255;255;255m"
 
 
+# Maps each hint to the (r, g, b) color of the letter it's shown with.
+HINT_COLORS = {"X": (127, 127, 127), "O": (255, 255, 0), "M": (0, 255, 0)}
+
+
 def FormatHints(guess: str, hints: str) -> str:
-    formatted = ""
-    for i, letter in enumerate(guess):
-        hint = hints[i]
-        if hint == "X":
-            formatted += Colored(127, 127, 127, letter)
-        elif hint == "O":
-            formatted += Colored(255, 255, 0, letter)
-        else:
-            formatted += Colored(0, 255, 0, letter)
-    return formatted
+    return "".join(
+        Colored(*HINT_COLORS[hint], letter) for letter, hint in zip(guess, hints)
+    )
+
+
+# Different games often end up with the same candidates (e.g. after the same
+# guesses and hints), so we remember the best guess for each candidate set.
+@functools.lru_cache(maxsize=2**16)
+def GetBestGuessForCandidates(packed_candidate_mask: bytes, try_all_words: bool) -> str:
+    """Returns the best guess for the given candidates.
+
+    Args:
+        packed_candidate_mask: the candidate mask (see WordleSolverBase) packed
+                               by np.packbits.
+        try_all_words: if True, the guess is chosen from all valid guesses
+                       instead of the candidates.
+    """
+    candidate_mask = np.unpackbits(
+        np.frombuffer(packed_candidate_mask, dtype=np.uint8), count=len(ALL_WORDS)
+    )
+    candidate_indices = np.flatnonzero(candidate_mask)
+    return GetWordWithHighestLetterFrequencies(
+        candidate_indices, ALL_WORD_INDICES if try_all_words else candidate_indices
+    )
+
+
+# The candidate mask every solver starts with.  It's read-only so that all
+# solvers can share it.
+ALL_CANDIDATES_MASK = np.ones(len(ALL_WORDS), dtype=bool)
+ALL_CANDIDATES_MASK.setflags(write=False)
 
 
 class WordleSolverBase:
@@ -279,19 +688,49 @@ class WordleSolverBase:
 
     def __init__(self):
         self.guess_hints = []  # Hints received so far.
-        self.candidates = ALL_WORDS[:]  # Valid guesses that satisfy all hints so far.
+        # candidate_mask[i] is True iff ALL_WORDS[i] satisfies all hints so far.
+        # It's never modified in place, as it may be shared.
+        self.candidate_mask = ALL_CANDIDATES_MASK
+
+    @property
+    def candidates(self) -> List[str]:
+        """Valid guesses that satisfy all hints so far.
+
+        This builds a new list; use num_candidates if only the count is needed.
+        """
+        return [ALL_WORDS[i] for i in np.flatnonzero(self.candidate_mask)]
+
+    @property
+    def num_candidates(self) -> int:
+        """The number of valid guesses that satisfy all hints so far."""
+        return int(np.count_nonzero(self.candidate_mask))
 
     def SuggestGuess(self) -> str:
         """Subclasses should implement this to return a suggested guess or None."""
         raise Exception("Not implemented.")
 
     def MakeGuess(self, guess: str, hints: str) -> None:
-        assert guess in ALL_WORDS, f"{guess} is an invalid word."
-        self.guess_hints.append((guess, hints))
-        self.candidates = FilterByHints(self.candidates, guess, hints)
+        self.MakeGuessWithHintCode(guess, EncodeHints(hints))
+
+    def MakeGuessWithHintCode(self, guess: str, hint_code: int) -> None:
+        """Like MakeGuess(), but takes the hints as a code."""
+        assert guess in WORD_INDEX, f"{guess} is an invalid word."
+        self.guess_hints.append((guess, DECODED_HINTS[hint_code]))
+        self.candidate_mask = FilterByHintCode(self.candidate_mask, guess, hint_code)
 
     def RestrictCandidatesToValidAnswers(self) -> None:
-        self.candidates = [word for word in self.candidates if word in VALID_ANSWER_SET]
+        self.candidate_mask = self.candidate_mask & VALID_ANSWER_MASK
+
+    def GetBestGuess(self, try_all_words: bool = False) -> str:
+        """Returns the word with the highest letter frequencies of the candidates.
+
+        Args:
+            try_all_words: if True, the guess is chosen from all valid guesses
+                           instead of the candidates.
+        """
+        return GetBestGuessForCandidates(
+            np.packbits(self.candidate_mask).tobytes(), try_all_words
+        )
 
 
 class HardModeEagerWordleSolver(WordleSolverBase):
@@ -320,7 +759,7 @@ class HardModeEagerWordleSolver(WordleSolverBase):
         num_guesses = len(self.guess_hints)
         if num_guesses == 0:
             self.RestrictCandidatesToValidAnswers()
-        return GetWordWithHighestLetterFrequencies(self.candidates, self.candidates)
+        return self.GetBestGuess()
 
 
 class IgnoreEarliestHintsWordleSolver(WordleSolverBase):
@@ -349,9 +788,7 @@ class IgnoreEarliestHintsWordleSolver(WordleSolverBase):
         num_guesses = len(self.guess_hints)
         if num_guesses == 2:
             self.RestrictCandidatesToValidAnswers()
-        return GetWordWithHighestLetterFrequencies(
-            self.candidates, ALL_WORDS if num_guesses < 2 else self.candidates
-        )
+        return self.GetBestGuess(try_all_words=num_guesses < 2)
 
 
 class AudioLeftyWordleSolver(WordleSolverBase):
@@ -384,7 +821,7 @@ class AudioLeftyWordleSolver(WordleSolverBase):
             return "LEFTY"
         if num_guesses == 3:
             self.RestrictCandidatesToValidAnswers()
-        return GetWordWithHighestLetterFrequencies(self.candidates, self.candidates)
+        return self.GetBestGuess()
 
 
 class AudioWordleSolver(WordleSolverBase):
@@ -415,7 +852,7 @@ class AudioWordleSolver(WordleSolverBase):
             return "AUDIO"
         if num_guesses == 2:  # 2,3,5 => 1.69%
             self.RestrictCandidatesToValidAnswers()
-        return GetWordWithHighestLetterFrequencies(self.candidates, self.candidates)
+        return self.GetBestGuess()
 
 
 class TwoCoverWordleSolver(WordleSolverBase):
@@ -443,7 +880,7 @@ class TwoCoverWordleSolver(WordleSolverBase):
         # Set best_pair to the result of GetWordPairsWithHighestLetterFrequencies(ALL_WORDS).
         # We hard code the words here as it's slow to call this function.
         # pairs = GetWordPairsWithHighestLetterFrequencies(ALL_WORDS)
-        # print(f'Found {len(pairs)} best pairs: {pairs}')  # 300 pairs.
+        # print(f'Found {len(pairs)} best pairs: {pairs}')  # 718 pairs.
         self.best_pair = ("STARN", "LOUIE")
 
     def SuggestGuess(self) -> str:
@@ -452,7 +889,7 @@ class TwoCoverWordleSolver(WordleSolverBase):
             return self.best_pair[num_guesses]
         if num_guesses == 2:
             self.RestrictCandidatesToValidAnswers()
-        return GetWordWithHighestLetterFrequencies(self.candidates, self.candidates)
+        return self.GetBestGuess()
 
 
 class ThreeCoverWordleSolver(WordleSolverBase):
@@ -499,10 +936,23 @@ class ThreeCoverWordleSolver(WordleSolverBase):
         if num_guesses == 4:
             # After 4 guesses, only try words that are valid answer words.
             self.RestrictCandidatesToValidAnswers()
-        return GetWordWithHighestLetterFrequencies(self.candidates, self.candidates)
+        return self.GetBestGuess()
+
 
+class ExperiencedWordleSolverBase(WordleSolverBase):
+    """Base class for solvers that use experience to improve the odds."""
 
-class ExperiencedThreeCoverWordleSolver(WordleSolverBase):
+    # Maps the guesses and hints so far to the next guess, for the cases where
+    # experience shows that GetBestGuess() doesn't do well.  Subclasses
+    # should override this.
+    EXPERIENCED_GUESSES = {}
+
+    def GetExperiencedGuess(self) -> str:
+        """Returns the experienced guess for the hints so far, or None."""
+        return self.EXPERIENCED_GUESSES.get(tuple(self.guess_hints))
+
+
+class ExperiencedThreeCoverWordleSolver(ExperiencedWordleSolverBase):
     """A solver that tries to cover the highest-frequency letters in the first 3 guesses and uses experience to improve the odds.
 
     Tested 2309 possible answers.
@@ -515,6 +965,67 @@ class ExperiencedThreeCoverWordleSolver(WordleSolverBase):
     Average # of guesses: 3.984.
     """
 
+    EXPERIENCED_GUESSES = {
+        (("LYRIC", "XXXXX"), ("UPSET", "OXXXM"), ("NOMAD", "OXXOX")): "VUGHS",
+        (("LYRIC", "XXXXO"), ("UPSET", "XXXXO"), ("NOMAD", "XXXOX")): "CROWS",
+        (("LYRIC", "XXXXX"), ("UPSET", "OXXXX"), ("NOMAD", "OMXXM")): "FROWN",
+        (("LYRIC", "OXOOX"), ("UPSET", "XXXXX"), ("WHIRL", "XXMOM")): "GREEK",
+        (
+            ("LYRIC", "XXOXX"),
+            ("UPSET", "XXXMX"),
+            ("NOMAD", "XMXXX"),
+            ("WOKER", "XMXMM"),
+        ): "RAVES",
+        (
+            ("LYRIC", "XXXXX"),
+            ("UPSET", "XXMOO"),
+            ("NOMAD", "XXXOX"),
+            ("WASTE", "XMMMM"),
+        ): "TOOTH",
+        (
+            ("LYRIC", "XXXXX"),
+            ("UPSET", "XXOOO"),
+            ("NOMAD", "XXXOX"),
+            ("STAKE", "MMMXM"),
+        ): "GOATS",
+        (
+            ("LYRIC", "OXOOX"),
+            ("UPSET", "XXXXX"),
+            ("NOMAD", "XXXXX"),
+            ("WHIRL", "XXMOM"),
+        ): "FROGS",
+        (
+            ("LYRIC", "OOXXX"),
+            ("UPSET", "XXXXX"),
+            ("NOMAD", "XMXXX"),
+            ("JOWLY", "XMXMM"),
+        ): "FROGS",
+        (
+            ("LYRIC", "OOXOX"),
+            ("UPSET", "XXXXX"),
+            ("NOMAD", "XXXXX"),
+            ("BIGLY", "XMXMM"),
+        ): "FROWN",
+        (
+            ("LYRIC", "XXOXX"),
+            ("UPSET", "XXXMX"),
+            ("NOMAD", "XMXXX"),
+            ("VOWER", "XMXMM"),
+        ): "BOOKS",
+        (
+            ("LYRIC", "OOXOX"),
+            ("UPSET", "XXXXX"),
+            ("NOMAD", "XXXXX"),
+            ("FILLY", "XMMMM"),
+        ): "HOBBY",
+        (
+            ("LYRIC", "OXXXX"),
+            ("UPSET", "OXOXX"),
+            ("NOMAD", "XXXXX"),
+            ("HULKS", "OOOXO"),
+        ): "BARFS",
+    }
+
     def __init__(self):
         super().__init__()
         # Set best_triple to the result of GetWordTriplesWithHighestLetterFrequencies(ALL_WORDS).
@@ -526,108 +1037,18 @@ class ExperiencedThreeCoverWordleSolver(WordleSolverBase):
             # Switch from exploration mode to solution mode early if there aren't
             # many remaining words.
             threshold = 3 ** (3 - num_guesses) * 4
-            if len(self.candidates) <= threshold:
+            if self.num_candidates <= threshold:
                 self.RestrictCandidatesToValidAnswers()
-                return GetWordWithHighestLetterFrequencies(
-                    self.candidates, self.candidates
-                )
+                return self.GetBestGuess()
 
             return self.best_triple[num_guesses]
-        if num_guesses == 3:
-            if self.guess_hints == [
-                ("LYRIC", "XXXXX"),
-                ("UPSET", "OXXXM"),
-                ("NOMAD", "OXXOX"),
-            ]:
-                return "VUGHS"
-            if self.guess_hints == [
-                ("LYRIC", "XXXXO"),
-                ("UPSET", "XXXXO"),
-                ("NOMAD", "XXXOX"),
-            ]:
-                return "CROWS"
-            if self.guess_hints == [
-                ("LYRIC", "XXXXX"),
-                ("UPSET", "OXXXX"),
-                ("NOMAD", "OMXXM"),
-            ]:
-                return "FROWN"
-            if self.guess_hints == [
-                ("LYRIC", "OXOOX"),
-                ("UPSET", "XXXXX"),
-                ("WHIRL", "XXMOM"),
-            ]:
-                return "GREEK"
         if num_guesses == 4:
             # After 4 guesses, only try words that are valid answer words.
             self.RestrictCandidatesToValidAnswers()
-            if self.guess_hints == [
-                ("LYRIC", "XXOXX"),
-                ("UPSET", "XXXMX"),
-                ("NOMAD", "XMXXX"),
-                ("WOKER", "XMXMM"),
-            ]:
-                return "RAVES"
-            if self.guess_hints == [
-                ("LYRIC", "XXXXX"),
-                ("UPSET", "XXMOO"),
-                ("NOMAD", "XXXOX"),
-                ("WASTE", "XMMMM"),
-            ]:
-                return "TOOTH"
-            if self.guess_hints == [
-                ("LYRIC", "XXXXX"),
-                ("UPSET", "XXOOO"),
-                ("NOMAD", "XXXOX"),
-                ("STAKE", "MMMXM"),
-            ]:
-                return "GOATS"
-            if self.guess_hints == [
-                ("LYRIC", "OXOOX"),
-                ("UPSET", "XXXXX"),
-                ("NOMAD", "XXXXX"),
-                ("WHIRL", "XXMOM"),
-            ]:
-                return "FROGS"
-            if self.guess_hints == [
-                ("LYRIC", "OOXXX"),
-                ("UPSET", "XXXXX"),
-                ("NOMAD", "XMXXX"),
-                ("JOWLY", "XMXMM"),
-            ]:
-                return "FROGS"
-            if self.guess_hints == [
-                ("LYRIC", "OOXOX"),
-                ("UPSET", "XXXXX"),
-                ("NOMAD", "XXXXX"),
-                ("BIGLY", "XMXMM"),
-            ]:
-                return "FROWN"
-            if self.guess_hints == [
-                ("LYRIC", "XXOXX"),
-                ("UPSET", "XXXMX"),
-                ("NOMAD", "XMXXX"),
-                ("VOWER", "XMXMM"),
-            ]:
-                return "BOOKS"
-            if self.guess_hints == [
-                ("LYRIC", "OOXOX"),
-                ("UPSET", "XXXXX"),
-                ("NOMAD", "XXXXX"),
-                ("FILLY", "XMMMM"),
-            ]:
-                return "HOBBY"
-            if self.guess_hints == [
-                ("LYRIC", "OXXXX"),
-                ("UPSET", "OXOXX"),
-                ("NOMAD", "XXXXX"),
-                ("HULKS", "OOOXO"),
-            ]:
-                return "BARFS"
-        return GetWordWithHighestLetterFrequencies(self.candidates, self.candidates)
-
-
-class NewThreeCoverWordleSolver(WordleSolverBase):
+        return self.GetExperiencedGuess() or self.GetBestGuess()
+
+
+class NewThreeCoverWordleSolver(ExperiencedWordleSolverBase):
     """A solver that tries to cover the highest-frequency letters in the first 3 guesses and uses experience to improve the odds.
     It differs from ExperiencedThreeCoverWordleSolver in that it picks a different
     starting triple, which doesn't consider non-answer words when computing the letter frequencies.
@@ -641,6 +1062,27 @@ class NewThreeCoverWordleSolver(WordleSolverBase):
     Average # of guesses: 3.846.
     """
 
+    EXPERIENCED_GUESSES = {
+        (("ROATE", "XXOMM"), ("SAUTE", "OMXMM")): "CHIPS",
+        (("ROATE", "XMXXX"), ("PULIS", "XOXXX"), ("CHYND", "XXXMM")): "BOWER",
+        (("ROATE", "OXOXO"), ("PULIS", "XXXXX"), ("CHYND", "XXXXX")): "WAGER",
+        (("ROATE", "OXOOO"), ("PULIS", "XXXXX"), ("CHYND", "XXXXX")): "TAMER",
+        (("ROATE", "XXOOX"), ("PULIS", "XOXXX"), ("CHYND", "XXXMX")): "TANGO",
+        (("ROATE", "XXOOX"), ("PULIS", "XXXXX"), ("CHYND", "OOXXX")): "BROWN",
+        (
+            ("ROATE", "XXXOX"),
+            ("PULIS", "XXXOX"),
+            ("CHYND", "XOXXX"),
+            ("MIGHT", "XMMMM"),
+        ): "FROWN",
+        (
+            ("ROATE", "OXXXO"),
+            ("PULIS", "XXXXX"),
+            ("CHYND", "XXOXX"),
+            ("JERKY", "XMMXM"),
+        ): "BLOOM",
+    }
+
     def __init__(self):
         super().__init__()
         # Set best_triple to the result of GetWordTriplesWithHighestLetterFrequencies(ALL_WORDS).
@@ -649,67 +1091,21 @@ class NewThreeCoverWordleSolver(WordleSolverBase):
     def SuggestGuess(self) -> str:
         num_guesses = len(self.guess_hints)
         if num_guesses < 3:
-            if self.guess_hints == [("ROATE", "XXOMM"), ("SAUTE", "OMXMM")]:
-                return "CHIPS"
+            guess = self.GetExperiencedGuess()
+            if guess:
+                return guess
             # Switch from exploration mode to solution mode early if there aren't
             # many remaining words.
             threshold = 3 ** (3 - num_guesses) * 4
-            if len(self.candidates) <= threshold:
+            if self.num_candidates <= threshold:
                 self.RestrictCandidatesToValidAnswers()
-                return GetWordWithHighestLetterFrequencies(
-                    self.candidates, self.candidates
-                )
+                return self.GetBestGuess()
 
             return self.best_triple[num_guesses]
-        if num_guesses == 3:
-            if self.guess_hints == [
-                ("ROATE", "XMXXX"),
-                ("PULIS", "XOXXX"),
-                ("CHYND", "XXXMM"),
-            ]:
-                return "BOWER"
-            if self.guess_hints == [
-                ("ROATE", "OXOXO"),
-                ("PULIS", "XXXXX"),
-                ("CHYND", "XXXXX"),
-            ]:
-                return "WAGER"
-            if self.guess_hints == [
-                ("ROATE", "OXOOO"),
-                ("PULIS", "XXXXX"),
-                ("CHYND", "XXXXX"),
-            ]:
-                return "TAMER"
-            if self.guess_hints == [
-                ("ROATE", "XXOOX"),
-                ("PULIS", "XOXXX"),
-                ("CHYND", "XXXMX"),
-            ]:
-                return "TANGO"
-            if self.guess_hints == [
-                ("ROATE", "XXOOX"),
-                ("PULIS", "XXXXX"),
-                ("CHYND", "OOXXX"),
-            ]:
-                return "BROWN"
         if num_guesses == 4:
             # After 4 guesses, only try words that are valid answer words.
             self.RestrictCandidatesToValidAnswers()
-            if self.guess_hints == [
-                ("ROATE", "XXXOX"),
-                ("PULIS", "XXXOX"),
-                ("CHYND", "XOXXX"),
-                ("MIGHT", "XMMMM"),
-            ]:
-                return "FROWN"
-            if self.guess_hints == [
-                ("ROATE", "OXXXO"),
-                ("PULIS", "XXXXX"),
-                ("CHYND", "XXOXX"),
-                ("JERKY", "XMMXM"),
-            ]:
-                return "BLOOM"
-        return GetWordWithHighestLetterFrequencies(self.candidates, self.candidates)
+        return self.GetExperiencedGuess() or self.GetBestGuess()
 
 
 def TrySolve(solver: WordleSolverBase, answer: str, show_process: bool = True) -> int:
@@ -723,14 +1119,14 @@ def TrySolve(solver: WordleSolverBase, answer: str, show_process: bool = True) -
             return 0
         if show_process:
             print(f"Guess #{attempt +1}: {guess}")
-        hints = GetHints(guess, answer)
-        if hints == "MMMMM":
+        hint_code = GetHintCode(guess, answer)
+        if hint_code == SOLVED_HINT_CODE:
             if show_process:
-                print(f"Success!  The answer is {FormatHints(guess, hints)}.")
+                print(f"Success!  The answer is {FormatHints(guess, DECODED_HINTS[hint_code])}.")
             return attempt + 1
         if show_process:
-            print(f"Hints: {FormatHints(guess, hints)}")
-        solver.MakeGuess(guess, hints)
+            print(f"Hints: {FormatHints(guess, DECODED_HINTS[hint_code])}")
+        solver.MakeGuessWithHintCode(guess, hint_code)
     if show_process:
         print("Oops, I ran out of attempts.")
     return 0
@@ -776,7 +1172,7 @@ def GetHintsFromWeb(tiles) -> str:
     return hints
 
 
-def TrySolveWeb(driver: webdriver.Chrome, solver: WordleSolverBase) -> int:
+def TrySolveWeb(driver: "webdriver.Chrome", solver: WordleSolverBase) -> int:
     """Solves the game on the NYT website.
 
     Returns:
@@ -812,7 +1208,7 @@ def TrySolveWeb(driver: webdriver.Chrome, solver: WordleSolverBase) -> int:
 
     for attempt in range(6):
         remaining_tiles = tiles[5 * attempt :]
-        num_candidates = len(solver.candidates)
+        num_candidates = solver.num_candidates
         print(f"{num_candidates} candidates remaining.")
         if num_candidates <= 10:
             print(" ".join(sorted(solver.candidates)))
@@ -860,25 +1256,45 @@ def WebDemo(solver_factory: Callable[[], WordleSolverBase]) -> None:
 def Demo(solver_factory: Callable[[], WordleSolverBase]) -> None:
     """Demostrates solving the game locally."""
 
-    random.seed()
     answer = random.choice(VALID_ANSWERS)
     TrySolve(solver_factory(), answer)
 
 
+def TrySolveQuietly(
+    solver_factory_and_answer: Tuple[Callable[[], WordleSolverBase], str]
+) -> Tuple[int, List[Tuple[str, str]]]:
+    """Solves for the given answer with a new solver without printing anything.
+
+    Returns:
+        the number of attempts (0 means failed) and the guesses and hints made.
+    """
+    solver_factory, answer = solver_factory_and_answer
+    solver = solver_factory()
+    num_guesses = TrySolve(solver, answer, show_process=False)
+    return num_guesses, solver.guess_hints
+
+
 def TestSolver(solver_factory: Callable[[], WordleSolverBase]) -> None:
     total_num_answers = len(VALID_ANSWERS)
     failed = []
     guess_freq = defaultdict(int)  # Maps # of guesses to frequency.
-    for i, answer in enumerate(VALID_ANSWERS):
-        solver = solver_factory()
-        num_guesses = TrySolve(solver, answer, show_process=False)
-        guess_freq[num_guesses] += 1
-        if not num_guesses:
-            print(
-                f"Failed to solve for answer {answer} (word {i} out of {total_num_answers})."
-            )
-            print(f"Trial history: {solver.guess_hints}")
-            failed.append(answer)
+    # The trials are independent, so we run them on all CPU cores.
+    with multiprocessing.Pool() as pool:
+        results = pool.imap(
+            TrySolveQuietly,
+            [(solver_factory, answer) for answer in VALID_ANSWERS],
+            chunksize=64,
+        )
+        for i, (answer, (num_guesses, guess_hints)) in enumerate(
+            zip(VALID_ANSWERS, results)
+        ):
+            guess_freq[num_guesses] += 1
+            if not num_guesses:
+                print(
+                    f"Failed to solve for answer {answer} (word {i} out of {total_num_answers})."
+                )
+                print(f"Trial history: {guess_hints}")
+                failed.append(answer)
 
     # Print statistics.
     print(f"Tested {total_num_answers} possible answers.")
@@ -895,7 +1311,7 @@ def TestSolver(solver_factory: Callable[[], WordleSolverBase]) -> None:
 
 
 def IsValidGuess(guess: str) -> bool:
-    return guess in ALL_WORDS
+    return guess in WORD_INDEX
 
 
 def IsValidHints(hints: str) -> bool:
@@ -914,7 +1330,7 @@ def Solve(solver_factory: Callable[[], WordleSolverBase]) -> None:
         if not suggested_guess:
             print("Hmm, I ran out of ideas.")
 
-        print(f"{len(solver.candidates)} words satisfy all hints so far.")
+        print(f"{solver.num_candidates} words satisfy all hints so far.")
         while True:
             guess = input(
                 f"What is your guess #{attempt + 1} (I suggest {suggested_guess})? "
@@ -943,21 +1359,21 @@ def Solve(solver_factory: Callable[[], WordleSolverBase]) -> None:
 
 
 def PrintLetterFrequencies() -> None:
-    freqs = list(GetLetterFrequencies(ALL_WORDS).items())
+    freqs = [
+        (chr(ord("A") + i), freq)
+        for i, freq in enumerate(GetLetterFrequencies(ALL_WORD_INDICES))
+    ]
     sorted_freqs = sorted(freqs, key=lambda pair: pair[1], reverse=True)
     for letter, freq in sorted_freqs:
         print(f"{letter}: {freq}")
 
 
 def PrintWordsWithHighestLetterFrequencies() -> None:
-    letter_freqs = GetLetterFrequencies(ALL_WORDS)
-    word_freq_pairs = []
-    for word in ALL_WORDS:
-        freq = sum(letter_freqs[ch] for ch in set(word))
-        word_freq_pairs.append((word, freq))
-    sorted_word_freq_pairs = sorted(
-        word_freq_pairs, key=lambda pair: pair[1], reverse=True
-    )
+    letter_freqs = GetLetterFrequencies(ALL_WORD_INDICES)
+    order, sorted_freqs = SortByLetterMaskFrequencies(WORD_MASKS, letter_freqs)
+    sorted_word_freq_pairs = [
+        (ALL_WORDS[i], freq) for i, freq in zip(order, sorted_freqs)
+    ]
     for word, freq in sorted_word_freq_pairs[:10]:
         print(f"{word}: {freq}")
     for word, freq in sorted_word_freq_pairs[-10:]: